@@ -0,0 +1,51 @@
+import pytest
+from causal_rag.core.pipeline import CausalRAGPipeline
+
+class TestCausalRAGPipeline:
+    """Test cases for CausalRAGPipeline."""
+    
+    def setup_method(self):
+        self.pipeline = CausalRAGPipeline()
+        self.pipeline.initialize([
+            "Yes, randomized controlled trial shows treatment is effective for heart disease.",
+            "Study shows no benefit of the drug for kidney disease.",
+            "Diet is correlated with improved heart health."
+        ])
+    
+    def test_batch_answer_matches_answer(self):
+        """Test that batched answers match answering one question at a time."""
+        questions = [
+            "Is treatment effective for heart disease?",
+            "Does the drug benefit kidney disease?",
+            "Does diet improve heart health?"
+        ]
+        
+        batched = self.pipeline.batch_answer(questions, top_k=2)
+        single = [self.pipeline.answer(question, top_k=2) for question in questions]
+        
+        assert len(batched) == len(single)
+        for batch_result, single_result in zip(batched, single):
+            assert batch_result.pop('retrieval_scores') == pytest.approx(single_result.pop('retrieval_scores'))
+            assert batch_result == single_result
+    
+    def test_batch_answer_columnar(self):
+        """Test columnar batch output."""
+        batch = self.pipeline.batch_answer_columnar(["Is treatment effective?"], top_k=2)
+        
+        assert len(batch) == 1
+        assert batch.answers[0] in ['yes', 'no', 'maybe']
+        assert batch.doc_indices.shape == (1, 2)
+    
+    def test_answer_requires_initialization(self):
+        """Test that answering before initialize() fails."""
+        with pytest.raises(ValueError):
+            CausalRAGPipeline().answer("Is treatment effective?")
+    
+    def test_save_and_load(self, tmp_path):
+        """Test that a loaded pipeline answers like the saved one."""
+        self.pipeline.save(str(tmp_path))
+        loaded = CausalRAGPipeline.load(str(tmp_path))
+        
+        assert loaded.is_initialized
+        question = "Is treatment effective for heart disease?"
+        assert loaded.answer(question, top_k=2)['answer'] == self.pipeline.answer(question, top_k=2)['answer']
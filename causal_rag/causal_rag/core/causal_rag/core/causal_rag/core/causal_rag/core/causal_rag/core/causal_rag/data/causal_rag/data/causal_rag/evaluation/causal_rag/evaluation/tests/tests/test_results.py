@@ -0,0 +1,68 @@
+import pytest
+import numpy as np
+from causal_rag.core.results import AnswerResult, BatchAnswerResult, pack_evidence, unpack_evidence
+
+class TestResults:
+    """Test cases for compact and columnar pipeline results."""
+
+    def setup_method(self):
+        self.store = [
+            "Randomized controlled trial shows treatment improves outcomes.",
+            "Study shows correlation between diet and heart health.",
+            "Research shows no significant benefit."
+        ]
+        self.analysis = {
+            'total_contexts': 2,
+            'consistent_yes': 1,
+            'consistent_no': 0,
+            'weak_evidence': 1,
+            'causal_evidence_count': 1,
+            'evidence_consistency': 1.0
+        }
+
+    def _result(self, question, answer, doc_indices, scores):
+        return AnswerResult(
+            question=question,
+            answer=answer,
+            confidence=0.9,
+            explanation="The evidence supports an affirmative answer.",
+            doc_indices=np.array(doc_indices, dtype=np.int64),
+            retrieval_scores=np.array(scores, dtype=np.float32),
+            evidence=pack_evidence(self.analysis),
+            store=self.store
+        )
+
+    def test_evidence_round_trip(self):
+        """Test packing and unpacking of evidence analysis."""
+        assert unpack_evidence(pack_evidence(self.analysis)) == self.analysis
+
+    def test_answer_result_references_store(self):
+        """Test that contexts are looked up rather than copied."""
+        result = self._result("Is treatment effective?", "yes", [2, 0], [1.5, 1.0])
+        assert result.contexts[0] is self.store[2]
+        assert not hasattr(result, '__dict__')
+
+    def test_answer_result_to_dict(self):
+        """Test conversion to the pipeline dictionary format."""
+        result = self._result("Is treatment effective?", "yes", [2, 0, 1], [1.5, 1.0, 0.5])
+        as_dict = result.to_dict()
+
+        assert as_dict['answer'] == "yes"
+        assert as_dict['retrieved_contexts'] == [self.store[2], self.store[0]]
+        assert as_dict['retrieved_count'] == 3
+        assert as_dict['evidence_analysis'] == self.analysis
+        assert all(isinstance(score, float) for score in as_dict['retrieval_scores'])
+
+    def test_batch_result_columns(self):
+        """Test columnar batch result with uneven retrieval counts."""
+        results = [
+            self._result("Is treatment effective?", "yes", [0, 1], [1.5, 1.0]),
+            self._result("Is diet relevant?", "maybe", [1], [0.8])
+        ]
+        batch = BatchAnswerResult.from_results(results, top_k=2, store=self.store)
+
+        assert len(batch) == 2
+        assert list(batch.answers) == ["yes", "maybe"]
+        assert batch.doc_indices[1].tolist() == [1, -1]
+        assert np.isnan(batch.retrieval_scores[1, 1])
+        assert batch.to_dicts() == [result.to_dict() for result in results]
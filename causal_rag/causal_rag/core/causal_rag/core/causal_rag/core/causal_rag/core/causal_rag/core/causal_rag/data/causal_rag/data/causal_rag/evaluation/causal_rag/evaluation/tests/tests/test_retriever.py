@@ -1,4 +1,5 @@
 import pytest
+import json
 import numpy as np
 from causal_rag.core.retriever import CausalRetriever
 
@@ -54,3 +55,89 @@ class TestCausalRetriever:
         assert len(results) == 2
         assert len(scores) == 2
         assert all(isinstance(score, float) for score in scores)
+    
+    def _documents(self):
+        return [
+            "Heart medication reduces risk of myocardial infarction.",
+            "Study shows correlation between diet and heart health.",
+            "Randomized trial proves drug efficacy for cardiac patients."
+        ]
+    
+    def test_batch_retrieval_clamps_top_k(self):
+        """Test that top_k larger than the number of documents is clamped."""
+        retriever = CausalRetriever()
+        retriever.build_index(self._documents())
+        
+        indices, scores = retriever.batch_retrieve_indices(["heart treatment"], top_k=30000000)
+        
+        assert indices.shape == (1, 3)
+        assert sorted(indices[0].tolist()) == [0, 1, 2]
+        assert not np.isnan(scores).any()
+    
+    def test_batch_retrieval_matches_single_query(self):
+        """Test that batched retrieval matches one query at a time."""
+        retriever = CausalRetriever()
+        retriever.build_index(self._documents())
+        queries = ["heart treatment", "diet and heart health", "cardiac drug trial"]
+        
+        batch_indices, batch_scores = retriever.batch_retrieve_indices(queries, top_k=2)
+        
+        for i, query in enumerate(queries):
+            indices, scores = retriever.retrieve_indices(query, top_k=2)
+            assert batch_indices[i].tolist() == indices.tolist()
+            np.testing.assert_allclose(batch_scores[i], scores, rtol=1e-5)
+    
+    def test_retrieval_matches_reference_ranking(self):
+        """Test retrieve() against a direct re-ranking of the FAISS candidates."""
+        retriever = CausalRetriever()
+        documents = self._documents()
+        retriever.build_index(documents)
+        query = "heart treatment"
+        
+        query_embedding = np.array(retriever.encoder.encode([query])).astype('float32')
+        semantic_scores, candidates = retriever.index.search(query_embedding, 6)
+        expected = []
+        for idx, semantic_score in zip(candidates[0], semantic_scores[0]):
+            if idx < 0:
+                continue
+            combined = semantic_score + retriever._calculate_causal_score(documents[idx]) * 0.5
+            expected.append((documents[idx], float(combined)))
+        expected.sort(key=lambda x: x[1], reverse=True)
+        
+        results, scores = retriever.retrieve(query, top_k=2)
+        
+        assert results == [doc for doc, _ in expected[:2]]
+        np.testing.assert_allclose(scores, [score for _, score in expected[:2]], rtol=1e-5)
+    
+    def test_save_and_load_index(self, tmp_path):
+        """Test that a saved index loads back with identical retrieval."""
+        retriever = CausalRetriever()
+        retriever.build_index(self._documents())
+        retriever.save_index(str(tmp_path))
+        
+        loaded = CausalRetriever()
+        loaded.load_index(str(tmp_path))
+        
+        assert loaded.knowledge_base == self._documents()
+        assert loaded.index.ntotal == 3
+        assert CausalRetriever.read_metadata(str(tmp_path)) == {
+            "model_name": "all-MiniLM-L6-v2",
+            "num_documents": 3
+        }
+        
+        results, scores = retriever.retrieve("heart treatment", top_k=2)
+        loaded_results, loaded_scores = loaded.retrieve("heart treatment", top_k=2)
+        assert loaded_results == results
+        np.testing.assert_allclose(loaded_scores, scores, rtol=1e-5)
+    
+    def test_load_index_rejects_mismatched_knowledge_base(self, tmp_path):
+        """Test that an index and knowledge base of different sizes are refused."""
+        retriever = CausalRetriever()
+        retriever.build_index(self._documents())
+        retriever.save_index(str(tmp_path))
+        
+        with open(tmp_path / "knowledge_base.json", 'w') as f:
+            json.dump(self._documents()[:2], f)
+        
+        with pytest.raises(ValueError):
+            CausalRetriever().load_index(str(tmp_path))
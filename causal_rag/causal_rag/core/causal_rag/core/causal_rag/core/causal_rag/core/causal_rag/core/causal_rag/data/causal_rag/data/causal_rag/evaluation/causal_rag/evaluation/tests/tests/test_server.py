@@ -0,0 +1,319 @@
+import json
+import os
+import queue
+import socket
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+import pytest
+import numpy as np
+from causal_rag.core.results import AnswerResult, BatchAnswerResult, pack_evidence
+from causal_rag.core.server import CausalRAGServer
+
+class StubPipeline:
+    """Pipeline stand-in that answers without loading an encoder."""
+
+    def __init__(self, answer="yes"):
+        self.answer = answer
+        self.store = ["Randomized controlled trial shows treatment improves outcomes."]
+        self.batch_sizes = []
+        self.is_initialized = True
+        self.gate = threading.Event()
+        self.gate.set()
+
+    def batch_answer_columnar(self, questions, top_k=3):
+        self.batch_sizes.append(len(questions))
+        self.gate.wait(10)
+        analysis = {
+            'total_contexts': 1,
+            'consistent_yes': 1,
+            'consistent_no': 0,
+            'weak_evidence': 0,
+            'causal_evidence_count': 1,
+            'evidence_consistency': 1.0
+        }
+        results = [
+            AnswerResult(question, self.answer, 0.9, "Stub explanation.",
+                         np.array([0]), np.array([1.5], dtype=np.float32),
+                         pack_evidence(analysis), self.store)
+            for question in questions
+        ]
+        return BatchAnswerResult.from_results(results, top_k, self.store)
+
+
+def raw_request(server, method, path, payload=None):
+    host, port = server.server_address
+    data = json.dumps(payload).encode("utf-8") if payload is not None else None
+    req = urllib.request.Request(f"http://{host}:{port}{path}", data=data, method=method,
+                                 headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(req, timeout=10) as response:
+            return response.status, json.loads(response.read()), response.headers
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read()), e.headers
+
+
+def socket_request(server, head, body=b"", timeout=5.0):
+    """Send a hand-written request and return the status code of the response."""
+    with socket.create_connection(server.server_address, timeout=timeout) as sock:
+        sock.sendall(head.encode("ascii") + b"\r\n\r\n" + body)
+        status_line = sock.makefile("rb").readline()
+    return int(status_line.split()[1])
+
+
+def request(server, method, path, payload=None):
+    status, body, _ = raw_request(server, method, path, payload)
+    return status, body
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("Condition not reached in time.")
+        time.sleep(0.01)
+
+
+class TestCausalRAGServer:
+    """Test cases for CausalRAGServer."""
+
+    def setup_method(self):
+        self.index_root = tempfile.mkdtemp()
+        self.loaded_paths = []
+        self.pipeline = StubPipeline()
+        self.server = CausalRAGServer(self.pipeline, port=0, max_wait_ms=50,
+                                      loader=self._load, index_root=self.index_root)
+        self.server.start()
+
+    def teardown_method(self):
+        self.server.stop()
+        os.rmdir(self.index_root)
+
+    def _load(self, path):
+        self.loaded_paths.append(path)
+        return StubPipeline(answer="no")
+
+    def test_health_and_metrics(self):
+        """Test health and metrics endpoints."""
+        status, health = request(self.server, "GET", "/health")
+        assert status == 200
+        assert health["status"] == "ok"
+
+        status, metrics = request(self.server, "GET", "/metrics")
+        assert status == 200
+        assert metrics["requests_total"] == 0
+        assert metrics["queue_capacity"] == 256
+
+    def test_answer(self):
+        """Test answering a single question."""
+        status, result = request(self.server, "POST", "/answer", {"question": "Is treatment effective?"})
+        assert status == 200
+        assert result["answer"] == "yes"
+        assert result["question"] == "Is treatment effective?"
+        assert result["retrieved_contexts"] == self.pipeline.store
+
+    def test_invalid_request(self):
+        """Test validation of request bodies."""
+        status, _ = request(self.server, "POST", "/answer", {"question": ""})
+        assert status == 400
+        status, _ = request(self.server, "POST", "/answer", {"question": "Q?", "top_k": 0})
+        assert status == 400
+
+    def test_top_k_above_limit_rejected(self):
+        """Test that oversized top_k is rejected before reaching the queue."""
+        status, _ = request(self.server, "POST", "/answer", {"question": "Q?", "top_k": 30000000})
+        assert status == 400
+        assert self.pipeline.batch_sizes == []
+
+    def test_concurrent_requests_are_batched(self):
+        """Test that requests arriving while a batch runs are answered together."""
+        statuses = []
+        def ask(i):
+            statuses.append(request(self.server, "POST", "/answer", {"question": f"Question {i}?"})[0])
+
+        # Hold the worker inside the first batch so the rest pile up in the queue
+        self.pipeline.gate.clear()
+        threads = [threading.Thread(target=ask, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        wait_for(lambda: self.server.metrics()["requests_total"] == 8)
+        time.sleep(0.1)
+        self.pipeline.gate.set()
+        for thread in threads:
+            thread.join()
+
+        assert statuses == [200] * 8
+        assert sum(self.pipeline.batch_sizes) == 8
+        assert max(self.pipeline.batch_sizes) > 1
+        _, metrics = request(self.server, "GET", "/metrics")
+        assert metrics["batched_questions_total"] == 8
+
+    def test_reload(self):
+        """Test swapping in a new index."""
+        status, reloaded = request(self.server, "POST", "/reload", {"index_path": "new-index"})
+        assert status == 200
+        assert reloaded["index_version"] == 2
+        assert self.loaded_paths == [os.path.join(os.path.realpath(self.index_root), "new-index")]
+
+        _, result = request(self.server, "POST", "/answer", {"question": "Is treatment effective?"})
+        assert result["answer"] == "no"
+
+    def test_reload_outside_index_root_rejected(self):
+        """Test that reload paths escaping the index root are refused."""
+        for index_path in ["../outside", "/tmp"]:
+            status, _ = request(self.server, "POST", "/reload", {"index_path": index_path})
+            assert status == 403
+        assert self.loaded_paths == []
+        assert self.server.index_version == 1
+
+    def test_reload_loader_error_returns_500(self):
+        """Test that a failing loader is reported as a failed reload, not a conflict."""
+        def broken_loader(path):
+            raise RuntimeError("Error in faiss::read_index: could not open index.faiss")
+        self.server.loader = broken_loader
+
+        status, body = request(self.server, "POST", "/reload", {"index_path": "broken-index"})
+        assert status == 500
+        assert body["error"].startswith("Reload failed")
+        assert self.server.metrics()["reloads_failed"] == 1
+        assert self.server.index_version == 1
+
+    def test_concurrent_reload_returns_409(self):
+        """Test that a reload during another reload is reported as a conflict."""
+        self.server._reload_lock.acquire()
+        try:
+            status, _ = request(self.server, "POST", "/reload", {"index_path": "new-index"})
+        finally:
+            self.server._reload_lock.release()
+        assert status == 409
+
+
+def test_backpressure():
+    """Test that a full queue rejects new requests."""
+    server = CausalRAGServer(StubPipeline(), port=0, max_queue_size=1)
+    try:
+        server.submit("First question?")
+        with pytest.raises(queue.Full):
+            server.submit("Second question?")
+    finally:
+        server.stop()
+
+
+def test_reload_disabled_without_index_root():
+    """Test that reloads are refused unless an index root is configured."""
+    server = CausalRAGServer(StubPipeline(), port=0)
+    try:
+        with pytest.raises(PermissionError):
+            server.reload("new-index")
+    finally:
+        server.stop()
+
+
+def test_health_reflects_readiness():
+    """Test that health is unavailable before start and after stop."""
+    server = CausalRAGServer(StubPipeline(), port=0)
+    assert server.health()["status"] == "unavailable"
+    server.start()
+    assert server.health()["status"] == "ok"
+    server.stop()
+    assert server.health()["status"] == "unavailable"
+
+
+def test_submit_after_stop_rejected():
+    """Test that requests arriving during shutdown fail immediately."""
+    server = CausalRAGServer(StubPipeline(), port=0)
+    server.stop()
+    with pytest.raises(RuntimeError):
+        server.submit("Late question?")
+
+
+def test_full_queue_returns_503():
+    """Test that a full queue rejects requests over HTTP with Retry-After."""
+    # No workers, so the first request stays queued until it times out
+    server = CausalRAGServer(StubPipeline(), port=0, num_workers=0, max_queue_size=1, request_timeout=1.0)
+    server.start()
+    try:
+        first = threading.Thread(target=request, args=(server, "POST", "/answer", {"question": "First?"}))
+        first.start()
+        wait_for(lambda: server.metrics()["queue_size"] == 1)
+
+        status, _, headers = raw_request(server, "POST", "/answer", {"question": "Second?"})
+        assert status == 503
+        assert headers["Retry-After"] == "1"
+        assert server.metrics()["requests_rejected"] == 1
+        first.join()
+    finally:
+        server.stop()
+
+
+def test_timeout_returns_504():
+    """Test that an unanswered request times out with 504."""
+    server = CausalRAGServer(StubPipeline(), port=0, num_workers=0, request_timeout=0.2)
+    server.start()
+    try:
+        status, _ = request(server, "POST", "/answer", {"question": "Anyone there?"})
+        assert status == 504
+        assert server.metrics()["requests_timed_out"] == 1
+    finally:
+        server.stop()
+
+
+def test_cancelled_requests_dropped_from_batch():
+    """Test that requests whose callers gave up are not answered."""
+    server = CausalRAGServer(StubPipeline(), port=0)
+    try:
+        cancelled = server.submit("Abandoned question?")
+        kept = server.submit("Live question?")
+        cancelled.cancelled = True
+
+        assert server._next_batch() == [kept]
+    finally:
+        server.stop()
+
+
+def test_invalid_content_length_rejected():
+    """Test that negative and oversized bodies are refused without reading them."""
+    server = CausalRAGServer(StubPipeline(), port=0, max_body_bytes=1024)
+    server.start()
+    try:
+        assert socket_request(server, "POST /answer HTTP/1.1\r\nContent-Length: -1") == 400
+        assert socket_request(server, "POST /answer HTTP/1.1\r\nContent-Length: 10000000") == 413
+    finally:
+        server.stop()
+
+
+def test_stalled_body_times_out():
+    """Test that a client that stops sending its body is answered with 408."""
+    server = CausalRAGServer(StubPipeline(), port=0, socket_timeout=0.3)
+    server.start()
+    try:
+        start = time.monotonic()
+        status = socket_request(server, "POST /answer HTTP/1.1\r\nContent-Length: 100", body=b'{"q')
+        assert status == 408
+        assert time.monotonic() - start < 3.0
+    finally:
+        server.stop()
+
+
+def test_queued_requests_rejected_on_shutdown():
+    """Test that requests still queued at shutdown get 503, not 500."""
+    server = CausalRAGServer(StubPipeline(), port=0, num_workers=0)
+    server.start()
+    responses = []
+    waiting = threading.Thread(
+        target=lambda: responses.append(raw_request(server, "POST", "/answer", {"question": "Queued?"}))
+    )
+    waiting.start()
+    wait_for(lambda: server.metrics()["queue_size"] == 1)
+
+    server.stop()
+    waiting.join()
+
+    status, _, headers = responses[0]
+    assert status == 503
+    assert headers["Retry-After"] == "1"
+    metrics = server.metrics()
+    assert metrics["requests_rejected"] == 1
+    assert metrics["requests_failed"] == 0
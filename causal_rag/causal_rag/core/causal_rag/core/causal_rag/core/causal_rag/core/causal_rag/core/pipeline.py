@@ -2,6 +2,7 @@ from typing import Dict, List, Optional
 from .retriever import CausalRetriever
 from .causal_analyzer import CausalAnalyzer
 from .generator import CausalGenerator
+from .results import AnswerResult, BatchAnswerResult, pack_evidence
 
 class CausalRAGPipeline:
     """
@@ -24,6 +25,32 @@ class CausalRAGPipeline:
         self.retriever.build_index(knowledge_base)
         self.is_initialized = True
     
+    def save(self, directory: str):
+        """
+        Persist the retrieval index and knowledge base.
+        
+        Args:
+            directory: Target directory, created if missing
+        """
+        self.retriever.save_index(directory)
+    
+    @classmethod
+    def load(cls, directory: str) -> "CausalRAGPipeline":
+        """
+        Create an initialized pipeline from an index written by save().
+        
+        Args:
+            directory: Directory containing the persisted index
+            
+        Returns:
+            Initialized CausalRAGPipeline
+        """
+        metadata = CausalRetriever.read_metadata(directory)
+        pipeline = cls(retriever_model=metadata["model_name"])
+        pipeline.retriever.load_index(directory)
+        pipeline.is_initialized = True
+        return pipeline
+    
     def answer(self, question: str, top_k: int = 3) -> Dict:
         """
         Answer a clinical question using causal-enhanced retrieval.
@@ -35,26 +62,28 @@ class CausalRAGPipeline:
         Returns:
             Dictionary containing answer, confidence, and metadata
         """
+        return self.answer_compact(question, top_k).to_dict()
+    
+    def answer_compact(self, question: str, top_k: int = 3) -> AnswerResult:
+        """
+        Answer a clinical question, returning a compact result.
+        
+        Retrieved documents are referenced by position in the retriever's
+        knowledge base instead of being copied into the result.
+        
+        Args:
+            question: Clinical question to answer
+            top_k: Number of contexts to retrieve
+            
+        Returns:
+            AnswerResult for the question
+        """
         if not self.is_initialized:
             raise ValueError("Pipeline not initialized. Call initialize() first.")
         
         # Step 1: Retrieve contexts with causal enhancement
-        contexts, retrieval_scores = self.retriever.retrieve(question, top_k=top_k)
-        
-        # Step 2: Analyze evidence quality
-        evidence_analysis = self.analyzer.analyze_evidence_quality(contexts, question)
-        
-        # Step 3: Generate final answer
-        result = self.generator.generate_answer(question, contexts, evidence_analysis)
-        
-        # Add retrieval metadata
-        result.update({
-            "retrieval_scores": retrieval_scores,
-            "retrieved_count": len(contexts),
-            "question": question
-        })
-        
-        return result
+        doc_indices, retrieval_scores = self.retriever.retrieve_indices(question, top_k=top_k)
+        return self._build_result(question, doc_indices, retrieval_scores)
     
     def batch_answer(self, questions: List[str], top_k: int = 3) -> List[Dict]:
         """
@@ -67,4 +96,53 @@ class CausalRAGPipeline:
         Returns:
             List of answer dictionaries
         """
-        return [self.answer(q, top_k) for q in questions]
+        return self.batch_answer_columnar(questions, top_k).to_dicts()
+    
+    def batch_answer_columnar(self, questions: List[str], top_k: int = 3) -> BatchAnswerResult:
+        """
+        Answer multiple questions, returning a columnar result.
+        
+        All questions are encoded and searched in a single call.
+        
+        Args:
+            questions: List of clinical questions
+            top_k: Number of contexts to retrieve per question
+            
+        Returns:
+            BatchAnswerResult with one row per question
+        """
+        if not self.is_initialized:
+            raise ValueError("Pipeline not initialized. Call initialize() first.")
+        
+        if len(questions) == 0:
+            return BatchAnswerResult.from_results([], top_k, self.retriever.knowledge_base)
+        
+        doc_indices, retrieval_scores = self.retriever.batch_retrieve_indices(questions, top_k=top_k)
+        
+        results = []
+        for question, row_indices, row_scores in zip(questions, doc_indices, retrieval_scores):
+            valid = row_indices >= 0
+            results.append(self._build_result(question, row_indices[valid], row_scores[valid]))
+        
+        return BatchAnswerResult.from_results(results, doc_indices.shape[1], self.retriever.knowledge_base)
+    
+    def _build_result(self, question: str, doc_indices, retrieval_scores) -> AnswerResult:
+        """Analyze retrieved documents and generate a compact result."""
+        contexts = self.retriever.get_documents(doc_indices)
+        
+        # Step 2: Analyze evidence quality
+        evidence_analysis = self.analyzer.analyze_evidence_quality(contexts, question)
+        
+        # Step 3: Generate final answer
+        answer, confidence, explanation = self.generator.generate_fields(contexts, evidence_analysis)
+        
+        return AnswerResult(
+            question=question,
+            answer=answer,
+            confidence=confidence,
+            explanation=explanation,
+            doc_indices=doc_indices,
+            retrieval_scores=retrieval_scores,
+            evidence=pack_evidence(evidence_analysis),
+            store=self.retriever.knowledge_base
+        )
@@ -0,0 +1,171 @@
+import numpy as np
+from typing import Dict, List, Sequence, Tuple
+
+# Fixed field order used to pack CausalAnalyzer output into a flat row
+EVIDENCE_FIELDS = (
+    'total_contexts',
+    'consistent_yes',
+    'consistent_no',
+    'weak_evidence',
+    'causal_evidence_count',
+    'evidence_consistency'
+)
+
+# Answers are stored as small integer codes into this tuple
+ANSWER_LABELS = ("yes", "no", "maybe")
+
+# Number of contexts exposed as "retrieved_contexts" in dictionary output
+TRANSPARENCY_CONTEXTS = 2
+
+
+def pack_evidence(evidence_analysis: Dict) -> Tuple:
+    """Pack an evidence analysis dictionary into a tuple ordered by EVIDENCE_FIELDS."""
+    return tuple(evidence_analysis[field] for field in EVIDENCE_FIELDS)
+
+
+def unpack_evidence(row: Sequence) -> Dict:
+    """Rebuild an evidence analysis dictionary from a packed row."""
+    analysis = {field: int(value) for field, value in zip(EVIDENCE_FIELDS[:-1], row)}
+    analysis['evidence_consistency'] = float(row[-1])
+    return analysis
+
+
+class AnswerResult:
+    """
+    Compact result for a single question.
+
+    Documents are referenced by position in the retriever's knowledge base
+    rather than copied; the dictionary form is built only by to_dict().
+    """
+
+    __slots__ = ('question', 'answer', 'confidence', 'explanation',
+                 'doc_indices', 'retrieval_scores', 'evidence', '_store')
+
+    def __init__(self, question: str, answer: str, confidence: float, explanation: str,
+                 doc_indices: np.ndarray, retrieval_scores: np.ndarray,
+                 evidence: Tuple, store: List[str]):
+        self.question = question
+        self.answer = answer
+        self.confidence = confidence
+        self.explanation = explanation
+        self.doc_indices = doc_indices
+        self.retrieval_scores = retrieval_scores
+        self.evidence = evidence
+        self._store = store
+
+    @property
+    def contexts(self) -> List[str]:
+        """Retrieved documents, looked up in the knowledge base."""
+        return [self._store[idx] for idx in self.doc_indices]
+
+    @property
+    def evidence_analysis(self) -> Dict:
+        """Evidence analysis in the CausalAnalyzer dictionary format."""
+        return unpack_evidence(self.evidence)
+
+    def to_dict(self) -> Dict:
+        """
+        Convert to the dictionary format returned by CausalRAGPipeline.answer.
+
+        Returns:
+            Dictionary containing answer, confidence, and metadata
+        """
+        return {
+            "answer": self.answer,
+            "confidence": self.confidence,
+            "explanation": self.explanation,
+            "evidence_analysis": self.evidence_analysis,
+            "retrieved_contexts": [self._store[idx] for idx in self.doc_indices[:TRANSPARENCY_CONTEXTS]],
+            "retrieval_scores": [float(score) for score in self.retrieval_scores],
+            "retrieved_count": len(self.doc_indices),
+            "question": self.question
+        }
+
+    def __repr__(self) -> str:
+        return (f"AnswerResult(answer={self.answer!r}, confidence={self.confidence:.2f}, "
+                f"doc_indices={self.doc_indices.tolist()})")
+
+
+class BatchAnswerResult:
+    """
+    Columnar result for a batch of questions.
+
+    Answers, confidences, document positions, scores and evidence counts are
+    held in NumPy arrays, one row per question. Document position rows are
+    padded with -1 and score rows with NaN when fewer than top_k documents
+    were retrieved.
+    """
+
+    __slots__ = ('questions', 'answer_codes', 'confidences', 'explanations',
+                 'doc_indices', 'retrieval_scores', 'evidence', '_store')
+
+    def __init__(self, questions: List[str], answer_codes: np.ndarray, confidences: np.ndarray,
+                 explanations: List[str], doc_indices: np.ndarray, retrieval_scores: np.ndarray,
+                 evidence: np.ndarray, store: List[str]):
+        self.questions = questions
+        self.answer_codes = answer_codes
+        self.confidences = confidences
+        self.explanations = explanations
+        self.doc_indices = doc_indices
+        self.retrieval_scores = retrieval_scores
+        self.evidence = evidence
+        self._store = store
+
+    @classmethod
+    def from_results(cls, results: List[AnswerResult], top_k: int, store: List[str]) -> "BatchAnswerResult":
+        """Assemble a columnar result from per-question compact results."""
+        n = len(results)
+        doc_indices = np.full((n, top_k), -1, dtype=np.int64)
+        retrieval_scores = np.full((n, top_k), np.nan, dtype=np.float32)
+        evidence = np.zeros((n, len(EVIDENCE_FIELDS)), dtype=np.float64)
+
+        for row, result in enumerate(results):
+            count = len(result.doc_indices)
+            doc_indices[row, :count] = result.doc_indices
+            retrieval_scores[row, :count] = result.retrieval_scores
+            evidence[row] = result.evidence
+
+        return cls(
+            questions=[result.question for result in results],
+            answer_codes=np.array([ANSWER_LABELS.index(result.answer) for result in results], dtype=np.int8),
+            confidences=np.array([result.confidence for result in results], dtype=np.float64),
+            explanations=[result.explanation for result in results],
+            doc_indices=doc_indices,
+            retrieval_scores=retrieval_scores,
+            evidence=evidence,
+            store=store
+        )
+
+    def __len__(self) -> int:
+        return len(self.questions)
+
+    @property
+    def answers(self) -> np.ndarray:
+        """Answer labels as a NumPy string array."""
+        return np.array(ANSWER_LABELS)[self.answer_codes]
+
+    def __getitem__(self, i: int) -> AnswerResult:
+        valid = self.doc_indices[i] >= 0
+        return AnswerResult(
+            question=self.questions[i],
+            answer=ANSWER_LABELS[self.answer_codes[i]],
+            confidence=float(self.confidences[i]),
+            explanation=self.explanations[i],
+            doc_indices=self.doc_indices[i][valid],
+            retrieval_scores=self.retrieval_scores[i][valid],
+            evidence=tuple(self.evidence[i]),
+            store=self._store
+        )
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def to_dicts(self) -> List[Dict]:
+        """
+        Convert to the list format returned by CausalRAGPipeline.batch_answer.
+
+        Returns:
+            List of answer dictionaries
+        """
+        return [result.to_dict() for result in self]
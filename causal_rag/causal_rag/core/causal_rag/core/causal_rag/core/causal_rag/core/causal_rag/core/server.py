@@ -0,0 +1,460 @@
+import argparse
+import json
+import os
+import queue
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .pipeline import CausalRAGPipeline
+
+
+class ReloadInProgressError(RuntimeError):
+    """Raised when a reload is requested while another one is still loading."""
+
+
+class _PendingAnswer:
+    """A queued /answer request waiting for its batch to complete."""
+
+    __slots__ = ('question', 'top_k', 'done', 'result', 'error', 'cancelled', 'shutdown')
+
+    def __init__(self, question: str, top_k: int):
+        self.question = question
+        self.top_k = top_k
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.cancelled = False
+        self.shutdown = False
+
+
+class CausalRAGServer:
+    """
+    Local HTTP server for a persisted Causal-RAG index.
+
+    Concurrent /answer requests are placed on a bounded queue and answered
+    in batches by worker threads, so that several questions share one
+    encode and one search call. When the queue is full, requests are
+    rejected with 503 instead of piling up. A new index can be loaded with
+    /reload while the current one keeps serving; reloads are only allowed
+    when index_root is set, and only from directories inside it.
+
+    Endpoints:
+        POST /answer   {"question": str, "top_k": int}
+        POST /reload   {"index_path": str}
+        GET  /health
+        GET  /metrics
+    """
+
+    def __init__(self, pipeline: CausalRAGPipeline, host: str = "127.0.0.1", port: int = 8000,
+                 max_batch_size: int = 32, max_wait_ms: float = 5.0, max_queue_size: int = 256,
+                 num_workers: int = 1, request_timeout: float = 30.0, max_top_k: int = 100,
+                 loader: Callable[[str], CausalRAGPipeline] = CausalRAGPipeline.load,
+                 index_path: Optional[str] = None, index_root: Optional[str] = None,
+                 max_body_bytes: int = 1024 * 1024, socket_timeout: float = 10.0):
+        self.pipeline = pipeline
+        self.index_path = index_path
+        self.index_root = os.path.realpath(index_root) if index_root is not None else None
+        self.index_version = 1
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.num_workers = num_workers
+        self.request_timeout = request_timeout
+        self.max_top_k = max_top_k
+        self.max_body_bytes = max_body_bytes
+        self.socket_timeout = socket_timeout
+        self.loader = loader
+
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._pipeline_lock = threading.Lock()
+        self._reload_lock = threading.Lock()
+        self._metrics_lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._submit_lock = threading.Lock()
+        self._workers = []
+        self._serve_thread = None
+        self._started_at = time.time()
+        self._metrics = {
+            'requests_total': 0,
+            'requests_rejected': 0,
+            'requests_failed': 0,
+            'requests_timed_out': 0,
+            'batches_total': 0,
+            'batched_questions_total': 0,
+            'reloads_total': 0,
+            'reloads_failed': 0
+        }
+
+        self.httpd = ThreadingHTTPServer((host, port), _RequestHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.app = self
+
+    @property
+    def server_address(self) -> Tuple[str, int]:
+        """Bound (host, port); useful when the server was created with port 0."""
+        return self.httpd.server_address[:2]
+
+    def start(self):
+        """Start batching workers and serve HTTP in a background thread."""
+        self._stopping.clear()
+        for i in range(self.num_workers):
+            worker = threading.Thread(target=self._batch_loop, name=f"causal-rag-batcher-{i}", daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+        self._serve_thread = threading.Thread(target=self.httpd.serve_forever, name="causal-rag-http", daemon=True)
+        self._serve_thread.start()
+
+    def serve_forever(self):
+        """Start batching workers and serve HTTP in the calling thread."""
+        self.start()
+        try:
+            self._serve_thread.join()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+    def stop(self):
+        """Stop accepting requests, reject queued ones with 503 and join worker threads."""
+        # Taken together with submit() so nothing is queued after the drain below
+        with self._submit_lock:
+            self._stopping.set()
+        if self._serve_thread is not None:
+            self.httpd.shutdown()
+            self._serve_thread = None
+        self.httpd.server_close()
+        for worker in self._workers:
+            worker.join()
+        self._workers = []
+
+        while True:
+            try:
+                pending = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            pending.shutdown = True
+            pending.done.set()
+
+    def submit(self, question: str, top_k: int = 3) -> _PendingAnswer:
+        """
+        Queue a question for batched answering.
+
+        Raises:
+            queue.Full: If the request queue is at capacity
+            RuntimeError: If the server is shutting down
+        """
+        pending = _PendingAnswer(question, top_k)
+        with self._submit_lock:
+            if self._stopping.is_set():
+                raise RuntimeError("Server shutting down.")
+            self._queue.put_nowait(pending)
+        return pending
+
+    def reload(self, index_path: str) -> int:
+        """
+        Load a new index and swap it in once it is ready.
+
+        Requests keep being served from the current index while the new one
+        loads. Batches already running finish on the index they started with.
+
+        Args:
+            index_path: Directory containing an index written by CausalRAGPipeline.save,
+                absolute or relative to index_root
+
+        Returns:
+            New index version number
+
+        Raises:
+            PermissionError: If reloads are disabled or the path is outside index_root
+            ReloadInProgressError: If another reload is in progress
+        """
+        index_path = self._resolve_index_path(index_path)
+        if not self._reload_lock.acquire(blocking=False):
+            raise ReloadInProgressError("A reload is already in progress.")
+        try:
+            try:
+                pipeline = self.loader(index_path)
+            except Exception:
+                self._increment('reloads_failed')
+                raise
+            with self._pipeline_lock:
+                self.pipeline = pipeline
+                self.index_path = index_path
+                self.index_version += 1
+                version = self.index_version
+            self._increment('reloads_total')
+            return version
+        finally:
+            self._reload_lock.release()
+
+    def _resolve_index_path(self, index_path: str) -> str:
+        """Resolve a reload path and check that it stays inside index_root."""
+        if self.index_root is None:
+            raise PermissionError("Reloads are disabled; start the server with an index root.")
+        resolved = os.path.realpath(os.path.join(self.index_root, index_path))
+        if os.path.commonpath([self.index_root, resolved]) != self.index_root:
+            raise PermissionError(f"Index path must be inside {self.index_root}.")
+        return resolved
+
+    def is_ready(self) -> bool:
+        """Whether the server is running, has live workers and an initialized pipeline."""
+        return (
+            not self._stopping.is_set()
+            and len(self._workers) > 0
+            and all(worker.is_alive() for worker in self._workers)
+            and getattr(self.pipeline, "is_initialized", False)
+        )
+
+    def health(self) -> Dict:
+        """Readiness information for the /health endpoint."""
+        return {
+            "status": "ok" if self.is_ready() else "unavailable",
+            "index_version": self.index_version,
+            "index_path": self.index_path
+        }
+
+    def metrics(self) -> Dict:
+        """Counters and gauges for the /metrics endpoint."""
+        with self._metrics_lock:
+            metrics = dict(self._metrics)
+        batches = metrics['batches_total']
+        metrics.update({
+            "queue_size": self._queue.qsize(),
+            "queue_capacity": self._queue.maxsize,
+            "mean_batch_size": metrics['batched_questions_total'] / batches if batches else 0.0,
+            "index_version": self.index_version,
+            "uptime_seconds": time.time() - self._started_at
+        })
+        return metrics
+
+    def _increment(self, name: str, amount: int = 1):
+        with self._metrics_lock:
+            self._metrics[name] += amount
+
+    def _next_batch(self) -> List[_PendingAnswer]:
+        """Block for the first request, then gather more until the batch is full or max_wait passes."""
+        try:
+            first = self._queue.get(timeout=0.1)
+        except queue.Empty:
+            return []
+
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        # Shed requests whose callers have already given up
+        return [pending for pending in batch if not pending.cancelled]
+
+    def _batch_loop(self):
+        while not self._stopping.is_set():
+            batch = self._next_batch()
+            if not batch:
+                continue
+
+            with self._pipeline_lock:
+                pipeline = self.pipeline
+
+            groups = {}
+            for pending in batch:
+                groups.setdefault(pending.top_k, []).append(pending)
+
+            for top_k, group in groups.items():
+                self._answer_group(pipeline, group, top_k)
+
+    def _answer_group(self, pipeline: CausalRAGPipeline, group: List[_PendingAnswer], top_k: int):
+        try:
+            results = pipeline.batch_answer_columnar([pending.question for pending in group], top_k=top_k)
+            for pending, result in zip(group, results):
+                pending.result = result.to_dict()
+        except Exception as e:
+            for pending in group:
+                pending.error = str(e)
+        finally:
+            self._increment('batches_total')
+            self._increment('batched_questions_total', len(group))
+            for pending in group:
+                pending.done.set()
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """Routes HTTP requests to the owning CausalRAGServer."""
+
+    def setup(self):
+        # Bound socket reads so a stalled client cannot hold a handler thread forever
+        self.timeout = self.server.app.socket_timeout
+        super().setup()
+
+    def do_GET(self):
+        app = self.server.app
+        if self.path == "/health":
+            health = app.health()
+            self._send_json(200 if health["status"] == "ok" else 503, health)
+        elif self.path == "/metrics":
+            self._send_json(200, app.metrics())
+        else:
+            self._send_json(404, {"error": f"Unknown endpoint: {self.path}"})
+
+    def do_POST(self):
+        app = self.server.app
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            self.close_connection = True
+            self._send_json(400, {"error": "Invalid Content-Length header."})
+            return
+        if length > app.max_body_bytes:
+            self.close_connection = True
+            self._send_json(413, {"error": f"Request body exceeds {app.max_body_bytes} bytes."})
+            return
+
+        try:
+            payload = self._read_json(length)
+        except socket.timeout:
+            self.close_connection = True
+            self._send_json(408, {"error": "Timed out reading request body."})
+            return
+        except ValueError as e:
+            self._send_json(400, {"error": str(e)})
+            return
+
+        if self.path == "/answer":
+            self._handle_answer(payload)
+        elif self.path == "/reload":
+            self._handle_reload(payload)
+        else:
+            self._send_json(404, {"error": f"Unknown endpoint: {self.path}"})
+
+    def _handle_answer(self, payload: Dict):
+        app = self.server.app
+        question = payload.get("question")
+        top_k = payload.get("top_k", 3)
+        if not isinstance(question, str) or not question.strip():
+            self._send_json(400, {"error": "'question' must be a non-empty string."})
+            return
+        if not isinstance(top_k, int) or isinstance(top_k, bool) or not 1 <= top_k <= app.max_top_k:
+            self._send_json(400, {"error": f"'top_k' must be an integer between 1 and {app.max_top_k}."})
+            return
+
+        app._increment('requests_total')
+        try:
+            pending = app.submit(question, top_k)
+        except queue.Full:
+            app._increment('requests_rejected')
+            self._send_json(503, {"error": "Server overloaded, request queue is full."},
+                            headers={"Retry-After": "1"})
+            return
+        except RuntimeError as e:
+            app._increment('requests_rejected')
+            self._send_json(503, {"error": str(e)}, headers={"Retry-After": "1"})
+            return
+
+        if not pending.done.wait(app.request_timeout):
+            pending.cancelled = True
+            app._increment('requests_timed_out')
+            self._send_json(504, {"error": "Timed out waiting for an answer."})
+        elif pending.shutdown:
+            app._increment('requests_rejected')
+            self._send_json(503, {"error": "Server shutting down."}, headers={"Retry-After": "1"})
+        elif pending.error is not None:
+            app._increment('requests_failed')
+            self._send_json(500, {"error": pending.error})
+        else:
+            self._send_json(200, pending.result)
+
+    def _handle_reload(self, payload: Dict):
+        app = self.server.app
+        index_path = payload.get("index_path")
+        if not isinstance(index_path, str) or not index_path:
+            self._send_json(400, {"error": "'index_path' must be a non-empty string."})
+            return
+
+        try:
+            version = app.reload(index_path)
+        except PermissionError as e:
+            self._send_json(403, {"error": str(e)})
+            return
+        except ReloadInProgressError as e:
+            self._send_json(409, {"error": str(e)})
+            return
+        except Exception as e:
+            self._send_json(500, {"error": f"Reload failed: {e}"})
+            return
+        self._send_json(200, {"index_version": version, "index_path": app.index_path})
+
+    def _read_json(self, length: int) -> Dict:
+        body = self.rfile.read(length) if length else b""
+        try:
+            payload = json.loads(body or b"{}")
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON body: {e}")
+        if not isinstance(payload, dict):
+            raise ValueError("JSON body must be an object.")
+        return payload
+
+    def _send_json(self, status: int, payload: Dict, headers: Optional[Dict[str, str]] = None):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Keep request logging out of stderr; use /metrics for monitoring
+        pass
+
+
+def main(argv: Optional[List[str]] = None):
+    """Command-line entry point: serve a persisted index over HTTP."""
+    parser = argparse.ArgumentParser(description="Serve a persisted Causal-RAG index over HTTP.")
+    parser.add_argument("--index", required=True, help="Directory written by CausalRAGPipeline.save")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--max-batch-size", type=int, default=32)
+    parser.add_argument("--max-wait-ms", type=float, default=5.0)
+    parser.add_argument("--max-queue-size", type=int, default=256)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--request-timeout", type=float, default=30.0)
+    parser.add_argument("--max-top-k", type=int, default=100)
+    parser.add_argument("--max-body-bytes", type=int, default=1024 * 1024)
+    parser.add_argument("--socket-timeout", type=float, default=10.0)
+    parser.add_argument("--index-root", default=None,
+                        help="Enable /reload for index directories inside this directory")
+    args = parser.parse_args(argv)
+
+    server = CausalRAGServer(
+        CausalRAGPipeline.load(args.index),
+        host=args.host,
+        port=args.port,
+        max_batch_size=args.max_batch_size,
+        max_wait_ms=args.max_wait_ms,
+        max_queue_size=args.max_queue_size,
+        num_workers=args.workers,
+        request_timeout=args.request_timeout,
+        max_top_k=args.max_top_k,
+        index_path=args.index,
+        index_root=args.index_root,
+        max_body_bytes=args.max_body_bytes,
+        socket_timeout=args.socket_timeout
+    )
+    host, port = server.server_address
+    print(f"Serving Causal-RAG index {args.index} on http://{host}:{port}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -25,9 +25,7 @@ class CausalGenerator:
         Returns:
             Dictionary containing answer, confidence, and explanation
         """
-        answer, confidence = self._determine_final_answer(evidence_analysis)
-        
-        explanation = self._generate_explanation(answer, confidence, evidence_analysis, contexts)
+        answer, confidence, explanation = self.generate_fields(contexts, evidence_analysis)
         
         return {
             "answer": answer,
@@ -37,6 +35,21 @@ class CausalGenerator:
             "retrieved_contexts": contexts[:2]  # Return top 2 contexts for transparency
         }
     
+    def generate_fields(self, contexts: List[str], evidence_analysis: Dict) -> Tuple[str, float, str]:
+        """
+        Generate answer, confidence and explanation without building a result dictionary.
+        
+        Args:
+            contexts: Retrieved context passages
+            evidence_analysis: Analysis from CausalAnalyzer
+            
+        Returns:
+            Tuple of (answer, confidence, explanation)
+        """
+        answer, confidence = self._determine_final_answer(evidence_analysis)
+        explanation = self._generate_explanation(answer, confidence, evidence_analysis, contexts)
+        return answer, confidence, explanation
+    
     def _determine_final_answer(self, evidence_analysis: Dict) -> Tuple[str, float]:
         """Determine final answer based on evidence analysis."""
         total_strong = evidence_analysis['consistent_yes'] + evidence_analysis['consistent_no']
@@ -2,6 +2,8 @@ import numpy as np
 import faiss
 from sentence_transformers import SentenceTransformer
 from typing import List, Tuple, Dict
+import json
+import os
 import re
 
 class CausalRetriever:
@@ -10,6 +12,7 @@ class CausalRetriever:
     """
     
     def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+        self.model_name = model_name
         self.encoder = SentenceTransformer(model_name)
         self.index = None
         self.knowledge_base = []
@@ -37,6 +40,48 @@ class CausalRetriever:
         self.index = faiss.IndexFlatIP(dimension)
         self.index.add(embeddings)
     
+    def save_index(self, directory: str):
+        """
+        Persist the FAISS index and knowledge base to a directory.
+        
+        Args:
+            directory: Target directory, created if missing
+        """
+        if self.index is None:
+            raise ValueError("Index not built. Call build_index first.")
+        
+        os.makedirs(directory, exist_ok=True)
+        faiss.write_index(self.index, os.path.join(directory, "index.faiss"))
+        with open(os.path.join(directory, "knowledge_base.json"), 'w') as f:
+            json.dump(self.knowledge_base, f)
+        with open(os.path.join(directory, "metadata.json"), 'w') as f:
+            json.dump({"model_name": self.model_name, "num_documents": len(self.knowledge_base)}, f)
+    
+    def load_index(self, directory: str):
+        """
+        Load a FAISS index and knowledge base written by save_index.
+        
+        Args:
+            directory: Directory containing the persisted index
+        """
+        with open(os.path.join(directory, "knowledge_base.json"), 'r') as f:
+            knowledge_base = json.load(f)
+        index = faiss.read_index(os.path.join(directory, "index.faiss"))
+        
+        if index.ntotal != len(knowledge_base):
+            raise ValueError(
+                f"Index has {index.ntotal} vectors but knowledge base has {len(knowledge_base)} documents."
+            )
+        
+        self.knowledge_base = knowledge_base
+        self.index = index
+    
+    @staticmethod
+    def read_metadata(directory: str) -> Dict:
+        """Read the metadata written alongside a persisted index."""
+        with open(os.path.join(directory, "metadata.json"), 'r') as f:
+            return json.load(f)
+    
     def _calculate_causal_score(self, text: str) -> float:
         """Calculate causal evidence score for a text passage."""
         score = 0
@@ -66,30 +111,79 @@ class CausalRetriever:
         Returns:
             Tuple of (retrieved_documents, combined_scores)
         """
+        indices, scores = self.retrieve_indices(query, top_k=top_k, causal_weight=causal_weight)
+        return self.get_documents(indices), [float(score) for score in scores]
+    
+    def retrieve_indices(self, query: str, top_k: int = 3,
+                         causal_weight: float = 0.5) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Retrieve positions in the knowledge base instead of document strings.
+        
+        Args:
+            query: Input query
+            top_k: Number of documents to retrieve
+            causal_weight: Weight for causal scoring vs semantic similarity
+            
+        Returns:
+            Tuple of (document_indices, combined_scores) as NumPy arrays
+        """
+        indices, scores = self.batch_retrieve_indices([query], top_k=top_k, causal_weight=causal_weight)
+        valid = indices[0] >= 0
+        return indices[0][valid], scores[0][valid]
+    
+    def batch_retrieve_indices(self, queries: List[str], top_k: int = 3,
+                               causal_weight: float = 0.5) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Retrieve document positions for several queries with one encode and one search call.
+        
+        Args:
+            queries: Input queries
+            top_k: Number of documents to retrieve per query
+            causal_weight: Weight for causal scoring vs semantic similarity
+            
+        Returns:
+            Tuple of (document_indices, combined_scores), each of shape
+            (len(queries), min(top_k, number of documents)). Rows with fewer
+            hits than that are padded with index -1 and score NaN.
+        """
         if self.index is None:
             raise ValueError("Index not built. Call build_index first.")
         
-        # Encode query
-        query_embedding = self.encoder.encode([query])
-        query_embedding = np.array(query_embedding).astype('float32')
+        # Encode all queries at once
+        query_embeddings = self.encoder.encode(list(queries))
+        query_embeddings = np.array(query_embeddings).astype('float32')
+        
+        # Never ask for more results than the index holds
+        top_k = min(top_k, self.index.ntotal)
         
         # Get initial candidates (more than needed)
-        initial_k = top_k * 3
-        semantic_scores, indices = self.index.search(query_embedding, initial_k)
-        semantic_scores = semantic_scores[0]
-        indices = indices[0]
-        
-        # Score candidates with causal enhancement
-        scored_documents = []
-        for idx, semantic_score in zip(indices, semantic_scores):
-            document = self.knowledge_base[idx]
-            causal_score = self._calculate_causal_score(document)
-            combined_score = semantic_score + (causal_score * causal_weight)
-            scored_documents.append((document, combined_score, causal_score))
-        
-        # Sort by combined score and return top_k
-        scored_documents.sort(key=lambda x: x[1], reverse=True)
-        final_documents = [doc[0] for doc in scored_documents[:top_k]]
-        final_scores = [doc[1] for doc in scored_documents[:top_k]]
-        
-        return final_documents, final_scores
+        initial_k = min(top_k * 3, self.index.ntotal)
+        semantic_scores, candidates = self.index.search(query_embeddings, initial_k)
+        
+        final_indices = np.full((len(queries), top_k), -1, dtype=np.int64)
+        final_scores = np.full((len(queries), top_k), np.nan, dtype=np.float32)
+        
+        for row, (row_indices, row_scores) in enumerate(zip(candidates, semantic_scores)):
+            # FAISS pads missing neighbours with -1
+            valid = row_indices >= 0
+            row_indices = row_indices[valid]
+            if len(row_indices) == 0:
+                continue
+            
+            # Score candidates with causal enhancement
+            causal_scores = np.array(
+                [self._calculate_causal_score(self.knowledge_base[idx]) for idx in row_indices],
+                dtype=np.float32
+            )
+            combined = row_scores[valid] + causal_scores * causal_weight
+            
+            # Stable sort by combined score and keep top_k
+            order = np.argsort(-combined, kind='stable')[:top_k]
+            final_indices[row, :len(order)] = row_indices[order]
+            final_scores[row, :len(order)] = combined[order]
+        
+        return final_indices, final_scores
+    
+    def get_documents(self, indices) -> List[str]:
+        """Look up documents in the knowledge base by position, skipping padding (-1)."""
+        return [self.knowledge_base[idx] for idx in indices if idx >= 0]
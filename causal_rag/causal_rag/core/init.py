@@ -2,10 +2,15 @@ from .retriever import CausalRetriever
 from .causal_analyzer import CausalAnalyzer
 from .generator import CausalGenerator
 from .pipeline import CausalRAGPipeline
+from .results import AnswerResult, BatchAnswerResult
+from .server import CausalRAGServer
 
 __all__ = [
     "CausalRetriever",
     "CausalAnalyzer",
     "CausalGenerator", 
-    "CausalRAGPipeline"
+    "CausalRAGPipeline",
+    "AnswerResult",
+    "BatchAnswerResult",
+    "CausalRAGServer"
 ]
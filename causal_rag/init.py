@@ -10,10 +10,15 @@ from causal_rag.core.causal_analyzer import CausalAnalyzer
 from causal_rag.core.retriever import CausalRetriever
 from causal_rag.core.generator import CausalGenerator
 from causal_rag.core.pipeline import CausalRAGPipeline
+from causal_rag.core.results import AnswerResult, BatchAnswerResult
+from causal_rag.core.server import CausalRAGServer
 
 __all__ = [
     "CausalAnalyzer",
     "CausalRetriever", 
     "CausalGenerator",
-    "CausalRAGPipeline"
+    "CausalRAGPipeline",
+    "AnswerResult",
+    "BatchAnswerResult",
+    "CausalRAGServer"
 ]